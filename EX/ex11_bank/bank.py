@@ -1,7 +1,9 @@
 """Bank."""
 
+import array
+import bisect
 import datetime
-import random
+import secrets
 
 
 class PersonError(Exception):
@@ -19,6 +21,8 @@ class TransactionError(Exception):
 class Person:
     """Person class."""
 
+    __slots__ = ("first_name", "last_name", "_full_name", "_age", "bank_account")
+
     def __init__(self, first_name: str, last_name: str, a: int):
         """
         Person constructor.
@@ -29,6 +33,7 @@ class Person:
         """
         self.first_name = first_name
         self.last_name = last_name
+        self._full_name = f"{first_name} {last_name}"
         if a >= 1:
             self._age = a
         else:
@@ -38,7 +43,7 @@ class Person:
     @property
     def full_name(self) -> str:
         """Get person's full name. Combination of first and last name."""
-        return f"{self.first_name} {self.last_name}"
+        return self._full_name
 
     @property
     def age(self) -> int:
@@ -52,6 +57,17 @@ class Person:
         if self._age <= 0:
             raise PersonError
 
+    def __eq__(self, other) -> bool:
+        """
+        Person equality is identity.
+
+        Two Person objects never compare equal by value; the bank's
+        customer registry relies on this.
+        """
+        return self is other
+
+    __hash__ = object.__hash__
+
     def __repr__(self) -> str:
         """
         Person representation.
@@ -61,9 +77,40 @@ class Person:
         return self.full_name
 
 
+class TransactionLog:
+    """
+    Columnar bank-wide transaction log.
+
+    Keeps one primitive row (amount, date ordinal, ATM flag) per
+    transaction instead of a reference to the Transaction object; the
+    per-account lists keep the objects for statements, so the bank-wide
+    log only pays a few bytes per row.
+    """
+
+    __slots__ = ("amount", "date_ord", "atm")
+
+    def __init__(self):
+        """Transaction log constructor."""
+        self.amount = array.array("d")
+        self.date_ord = array.array("l")
+        self.atm = array.array("b")
+
+    def append(self, transaction: 'Transaction'):
+        """Append one transaction's primitive fields to the columns."""
+        self.amount.append(transaction.amount)
+        self.date_ord.append(transaction.date_ord)
+        self.atm.append(transaction.is_from_atm)
+
+    def __len__(self) -> int:
+        """Number of logged transactions."""
+        return len(self.amount)
+
+
 class Bank:
     """Bank class."""
 
+    __slots__ = ("name", "customers", "_customer_ids", "transactions")
+
     def __init__(self, name: str):
         """
         Bank constructor.
@@ -72,7 +119,8 @@ class Bank:
         """
         self.name = name
         self.customers = []
-        self.transactions = []
+        self._customer_ids = set()
+        self.transactions = TransactionLog()
 
     def add_customer(self, person: Person) -> bool:
         """
@@ -81,12 +129,12 @@ class Bank:
         :param person: person object
         :return: was customer successfully added
         """
-        if person not in self.customers:
-            person.bank_account = Account(0, person, self)
-            self.customers.append(person)
-            return True
-        else:
+        if id(person) in self._customer_ids:
             return False
+        person.bank_account = Account(0, person, self)
+        self.customers.append(person)
+        self._customer_ids.add(id(person))
+        return True
 
     def remove_customer(self, person: Person) -> bool:
         """
@@ -95,12 +143,12 @@ class Bank:
         :param person: person object
         :return: was customer successfully removed
         """
-        for i in self.customers:
-            if i == person:
-                person.bank_account = None
-                self.customers.remove(i)
-                return True
-        return False
+        if id(person) not in self._customer_ids:
+            return False
+        person.bank_account = None
+        self._customer_ids.discard(id(person))
+        self.customers.remove(person)
+        return True
 
     def __repr__(self) -> str:
         """
@@ -114,6 +162,8 @@ class Bank:
 class Transaction:
     """Transaction class."""
 
+    __slots__ = ("amount", "date", "date_ord", "sender_account", "receiver_account", "is_from_atm")
+
     def __init__(self, amount: float, date: datetime.date, sender_account: 'Account', receiver_account: 'Account',
                  is_from_atm: bool):
         """
@@ -127,6 +177,7 @@ class Transaction:
         """
         self.amount = amount
         self.date = date
+        self.date_ord = date.toordinal()
         self.sender_account = sender_account
         self.receiver_account = receiver_account
         self.is_from_atm = is_from_atm
@@ -143,9 +194,19 @@ class Transaction:
             return f"({self.amount} €) {self.sender_account.person.full_name} -> {self.receiver_account.person.full_name}"
 
 
+# Side of a transaction as seen from the account that recorded it.
+SIDE_ATM_DEPOSIT = 0
+SIDE_ATM_WITHDRAW = 1
+SIDE_TRANSFER_IN = 2
+SIDE_TRANSFER_OUT = 3
+
+
 class Account:
     """Account class."""
 
+    __slots__ = ("_balance", "person", "bank", "transactions", "number", "_tx_amount",
+                 "_tx_date_ord", "_tx_side", "_tx_debit", "_tx_credit")
+
     def __init__(self, balance: float, person: Person, bank: 'Bank'):
         """
         Account constructor.
@@ -158,56 +219,113 @@ class Account:
         self.person = person
         self.bank = bank
         self.transactions = []
-        self.number = f"EE{random.randint(100000000000000000, 999999999999999999)}"
+        self._tx_amount = array.array("d")
+        self._tx_date_ord = array.array("l")
+        self._tx_side = array.array("B")
+        self._tx_debit = array.array("d")
+        self._tx_credit = array.array("d")
+        self.number = f"EE{100000000000000000 + secrets.randbits(60) % 900000000000000000}"
 
     @property
     def balance(self) -> float:
         """Get account's balance."""
         return self._balance
 
-    def deposit(self, amount: float, is_from_atm: bool = True):
+    def _record(self, transaction: Transaction):
+        """
+        Append transaction to the object list and the parallel column arrays.
+
+        The transaction's side as seen from this account is classified
+        here once, and the signed debit/credit contribution of the row
+        follows from the side code, so the turnover scans stay
+        branch-free.
+        """
+        amount = transaction.amount
+        if transaction.is_from_atm:
+            side = SIDE_ATM_DEPOSIT if amount > 0 else SIDE_ATM_WITHDRAW
+        elif transaction.receiver_account is self:
+            side = SIDE_TRANSFER_IN
+        else:
+            side = SIDE_TRANSFER_OUT
+        self.transactions.append(transaction)
+        self._tx_amount.append(amount)
+        self._tx_date_ord.append(transaction.date_ord)
+        self._tx_side.append(side)
+        self._tx_debit.append(amount if side == SIDE_ATM_DEPOSIT or side == SIDE_TRANSFER_IN else 0.0)
+        if side == SIDE_ATM_WITHDRAW:
+            self._tx_credit.append(amount)
+        elif side == SIDE_TRANSFER_OUT:
+            self._tx_credit.append(-amount)
+        else:
+            self._tx_credit.append(0.0)
+
+    def deposit(self, amount: float, is_from_atm: bool = True, _today: datetime.date = None):
         """Deposit money to account."""
         if amount <= 0:
             raise TransactionError
         self._balance += amount
         if is_from_atm:
-            transaction = Transaction(amount, datetime.date.today(), self, self, is_from_atm)
-            self.transactions.append(transaction)
+            transaction = Transaction(amount, _today or datetime.date.today(), self, self, is_from_atm)
+            self._record(transaction)
             self.bank.transactions.append(transaction)
 
-    def withdraw(self, amount: float, is_from_atm: bool = True):
+    def withdraw(self, amount: float, is_from_atm: bool = True, _today: datetime.date = None):
         """Withdraw money from account."""
         if amount <= 0 or self._balance < amount:
             raise TransactionError
         self._balance -= amount
         if is_from_atm:
-            transaction = Transaction(-amount, datetime.date.today(), self, self, is_from_atm)
-            self.transactions.append(transaction)
+            transaction = Transaction(-amount, _today or datetime.date.today(), self, self, is_from_atm)
+            self._record(transaction)
             self.bank.transactions.append(transaction)
 
     def transfer(self, amount: float, receiver_account: 'Account'):
         """Transfer money from one account to another."""
         if self._balance >= amount + 5 and self.person != receiver_account.person or receiver_account != self:
-            t = Transaction(amount, datetime.date.today(), self, receiver_account, False)
+            today = datetime.date.today()
+            t = Transaction(amount, today, self, receiver_account, False)
             if self.bank != receiver_account.bank:
-                self.withdraw(amount + 5, False)
+                self.withdraw(amount + 5, False, _today=today)
                 receiver_account.bank.transactions.append(t)
             else:
-                self.withdraw(amount, False)
-            receiver_account.deposit(amount, False)
-            receiver_account.transactions.append(t)
+                self.withdraw(amount, False, _today=today)
+            receiver_account.deposit(amount, False, _today=today)
+            receiver_account._record(t)
             self.bank.transactions.append(t)
-            self.transactions.append(t)
+            self._record(t)
         else:
             raise TransactionError
 
+    def _date_window(self, lo: int, hi: int) -> tuple:
+        """
+        Find the index range of transactions dated within [lo, hi].
+
+        Transactions are recorded with date.today(), so the date column
+        is non-decreasing and the window is a contiguous slice found by
+        binary search.
+
+        :param lo: from date ordinal (included)
+        :param hi: to date ordinal (included)
+        :return: (start, stop) index tuple
+        """
+        return (bisect.bisect_left(self._tx_date_ord, lo),
+                bisect.bisect_right(self._tx_date_ord, hi))
+
     def account_statement(self, from_date: datetime.date, to_date: datetime.date) -> list:
         """All transactions in given period."""
-        account_statement_list = []
-        for i in self.transactions:
-            if from_date <= i.date <= to_date:
-                account_statement_list.append(i)
-        return account_statement_list
+        start, stop = self._date_window(from_date.toordinal(), to_date.toordinal())
+        return self.transactions[start:stop]
+
+    def _scan(self, lo: int, hi: int) -> tuple:
+        """
+        Sum debit and credit turnover between two date ordinals in one pass.
+
+        :param lo: from date ordinal (included)
+        :param hi: to date ordinal (included)
+        :return: (debit, credit) tuple
+        """
+        start, stop = self._date_window(lo, hi)
+        return sum(self._tx_debit[start:stop]), sum(self._tx_credit[start:stop])
 
     def get_debit_turnover(self, from_date: datetime.date, to_date: datetime.date) -> float:
         """
@@ -217,12 +335,7 @@ class Account:
         :param to_date: to date object (included)
         :return: debit turnover number
         """
-        counter = 0
-        for i in self.transactions:
-            if from_date <= i.date <= to_date:
-                if i.amount > 0 and i.is_from_atm or self == i.receiver_account and i.is_from_atm is False:
-                    counter += i.amount
-        return counter
+        return self._scan(from_date.toordinal(), to_date.toordinal())[0]
 
     def get_credit_turnover(self, from_date: datetime.date, to_date: datetime.date) -> float:
         """
@@ -232,12 +345,7 @@ class Account:
         :param to_date: to date object (included)
         :return: credit turnover number
         """
-        counter = 0
-        for i in self.transactions:
-            if from_date <= i.date <= to_date:
-                if i.amount < 0 or self == i.sender_account and i.is_from_atm is False:
-                    counter -= abs(i.amount)
-        return counter
+        return self._scan(from_date.toordinal(), to_date.toordinal())[1]
 
     def get_net_turnover(self, from_date: datetime.date, to_date: datetime.date) -> float:
         """
@@ -247,7 +355,19 @@ class Account:
         :param to_date: to date object (included)
         :return: net turnover number
         """
-        return self.get_debit_turnover(from_date, to_date) + self.get_credit_turnover(from_date, to_date)
+        debit, credit = self._scan(from_date.toordinal(), to_date.toordinal())
+        return debit + credit
+
+    def __eq__(self, other) -> bool:
+        """
+        Account equality is identity.
+
+        Matches the transfer checks, which compare account and person
+        objects for being the same instance.
+        """
+        return self is other
+
+    __hash__ = object.__hash__
 
     def __repr__(self) -> str:
         """
@@ -14,17 +14,9 @@ def positive_or_not(nums: list, pos: bool) -> list:
     :param nums:
     :return:
     """
-    list_list = []
     if pos:
-        for a in nums:
-            if a >= 1:
-                list_list.append(a)
-        return list_list
-    else:
-        for a in nums:
-            if a <= 0:
-                list_list.append(a)
-        return list_list
+        return [a for a in nums if a >= 1]
+    return [a for a in nums if a <= 0]
 
 
 def sum_half_evens(nums: list) -> int:
@@ -38,47 +30,32 @@ def sum_half_evens(nums: list) -> int:
     sum_half_evens([1, 3, 5, 8]) => 8
     sum_half_evens([2, 3, 5, 7, 8, 9, 10, 11]) => 10
     """
-    list_list = []
-    for a in nums:
-        if a % 2 == 0:
-            list_list.append(a)
-    indexx = len(list_list) // 2
-    counter = list_list[0: indexx]
-    if len(counter) >= 1:
-        if len(list_list) % 2 != 0:
-            a = list_list[len(list_list) // 2]
-            for al in counter:
-                al += al
-            b = al + a
-            return b
-        else:
-            for al in counter:
-                al += al
-            b = al
-            return b
-    else:
-        if len(list_list) % 2 != 0:
-            a = list_list[len(list_list) // 2]
-            return a
-        else:
-            return 0
+    evens = [a for a in nums if a % 2 == 0]
+    return sum(evens[:(len(evens) + 1) // 2])
 
 
 def max_block(s: str) -> int:
     """
-    Get full name of the person.
+    Return the length of the largest block in the given string.
+
+    A block is a run of adjacent chars that are the same.
 
-    Return firstname and lastname separated by space.
-    If the lastname is empty, then return only the firstname.
+    max_block("hoopla") => 2
+    max_block("abbCCCddBBBxx") => 3
+    max_block("") => 0
     """
-    counter = 0
-    if len(s) >= 1:
-        for char in s:
-            count = s.count(char)
-            if count >= counter:
-                counter = count
-        return counter
-    return counter
+    best = 0
+    current = 0
+    prev = None
+    for char in s:
+        if char == prev:
+            current += 1
+        else:
+            current = 1
+            prev = char
+        if current > best:
+            best = current
+    return best
 
 
 class Person:
@@ -89,6 +66,7 @@ class Person:
         self._firstname = firstname
         self._lastname = lastname
         self._phone_number = phone_number
+        self._full_name = firstname + " " + lastname if lastname else firstname
 
     def get_full_name(self) -> str:
         """
@@ -97,7 +75,7 @@ class Person:
         Return firstname and lastname separated by space.
         If the lastname is empty, then return only the firstname.
         """
-        return self._firstname + " " + self._lastname
+        return self._full_name
 
     @property
     def firstname(self):
@@ -126,9 +104,13 @@ class ContactBook:
     def __init__(self):
         """Constructor."""
         self.contacts = []
+        self._by_number = {}
 
     def add_person_to_contacts(self, person: Person) -> None:
         """Add person to contact book if phone number and firstname are not empty strings."""
+        if person.firstname and person._phone_number:
+            self.contacts.append(person)
+            self._by_number.setdefault(person._phone_number, person)
 
     def find_contact_by_number(self, number) -> Person:
         """
@@ -137,11 +119,11 @@ class ContactBook:
         If there are several people with the given number, return the first.
         If there is no person with the given number, return None.
         """
-        pass
+        return self._by_number.get(number)
 
     def get_sorted_contacts(self) -> list:
         """Sort contacts alphabetically by full name."""
-        pass
+        return sorted(self.contacts, key=lambda person: person._full_name)
 
 
 class FridgeItem: